@@ -37,6 +37,16 @@ class Settings(BaseSettings):
         description='LangChain project name for organizing resources.',
         examples=['my-langchain-project'],
     )
+    ARXIV_MAX_CONCURRENCY: int = Field(
+        default=5,
+        description='Maximum number of arXiv papers downloaded and parsed concurrently.',
+        examples=[1, 5, 10],
+    )
+    ARXIV_LOAD_TIMEOUT: float | None = Field(
+        default=None,
+        description='Per-paper timeout in seconds for downloading and parsing an arXiv PDF. None disables the timeout.',
+        examples=[30.0, 60.0],
+    )
 
     model_config = SettingsConfigDict(
         env_file='.env',
@@ -6,7 +6,6 @@ from typing import Optional, TypedDict
 import arxiv
 from dotenv import load_dotenv
 from google.oauth2 import service_account
-from langchain_community.document_loaders import ArxivLoader
 from langchain_core.documents import Document
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import ChatPromptTemplate
@@ -19,6 +18,8 @@ from pydantic import BaseModel, Field
 from config.settings import config
 from utils.logger import get_logger
 
+from .paper_loader import ArxivPaperLoader
+
 logger = get_logger(__name__)
 
 
@@ -43,7 +44,7 @@ class ArticleSearchState(BaseModel):
 
 
 class ArticleSearchGraph:
-    def __init__(self, llm: Optional[ChatVertexAI] = None):
+    def __init__(self, llm: Optional[ChatVertexAI] = None, paper_loader: Optional[ArxivPaperLoader] = None):
         """
         ArticleSearchGraphのコンストラクタ
         このクラスは、ArXivでの論文検索を行うためのワークフローを定義します。
@@ -61,8 +62,13 @@ class ArticleSearchGraph:
 
         Args:
             llm (Optional[ChatVertexAI]): 使用するLLMインスタンス。指定しない場合は、Google Cloudのサービスアカウントキーを使用して初期化されます。
+            paper_loader (Optional[ArxivPaperLoader]): 論文PDFの読み込みに使用するローダー。指定しない場合は、設定値の同時実行数とタイムアウトで初期化されます。
         """
         self._llm = llm or self._init_llm()
+        self._paper_loader = paper_loader or ArxivPaperLoader(
+            max_concurrency=config.ARXIV_MAX_CONCURRENCY,
+            timeout=config.ARXIV_LOAD_TIMEOUT,
+        )
         self._workflow_builder = StateGraph(ArticleSearchState)
         self._runnable_workflow = self._build_workflow()
 
@@ -165,6 +171,7 @@ class ArticleSearchGraph:
     async def _convert_to_documents(self, search_results: list[arxiv.Result]) -> list[Document]:
         """
         ArXivの検索結果をDocumentオブジェクトのリストに変換する関数
+        論文の読み込みは同時実行数を制限しながら並行して行われ、失敗した論文はスキップされます。
 
         Args:
             search_results (list[arxiv.Result]): ArXivの検索結果
@@ -172,23 +179,7 @@ class ArticleSearchGraph:
         Returns:
             list[Document]: Documentオブジェクトのリスト
         """
-        documents = []
-        try:
-            for result in search_results:
-                pdf_query = result.pdf_url.split('/')[-1]
-                pdf_loader = ArxivLoader(query=pdf_query)
-                pdf_docs = pdf_loader.load()
-                if not pdf_docs:
-                    logger.warning(f'PDFドキュメントが見つかりませんでした: {result.pdf_url}')
-                    continue
-
-                documents.append(pdf_docs[0])
-
-            return documents
-
-        except Exception as e:
-            logger.error(f'ArXivの検索結果をDocumentに変換中にエラーが発生しました: {e}')
-            return []
+        return await self._paper_loader.aload(search_results)
 
     def _search_arxiv_papers(self, query_obj: ArxivQuery, max_docs: int = 5):
         """
@@ -0,0 +1,88 @@
+import asyncio
+from typing import Optional
+
+import arxiv
+from langchain_community.document_loaders import ArxivLoader
+from langchain_core.documents import Document
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ArxivPaperLoader:
+    def __init__(self, max_concurrency: int = 5, timeout: Optional[float] = None):
+        """
+        ArxivPaperLoaderのコンストラクタ
+        ArXivの検索結果からPDFを並行してダウンロード・解析し、Documentに変換します。
+
+        ArxivLoaderは同期APIのため、各論文の読み込みはスレッドプール上で実行され、イベントループをブロックしません。
+        同時に実行される読み込み数はセマフォで制限されます。
+        一部の論文の読み込みに失敗した場合やタイムアウトした場合でも、その論文をスキップして残りの論文の読み込みを継続します。
+
+        Args:
+            max_concurrency (int): 同時に読み込む論文の最大数
+            timeout (Optional[float]): 論文1件あたりのタイムアウト秒数。Noneの場合はタイムアウトしません。
+        Raises:
+            ValueError: max_concurrencyが1未満の場合
+        """
+        if max_concurrency < 1:
+            raise ValueError('max_concurrencyは1以上である必要があります。')
+
+        self._max_concurrency = max_concurrency
+        self._timeout = timeout
+
+    async def aload(self, search_results: list[arxiv.Result]) -> list[Document]:
+        """
+        ArXivの検索結果を並行してDocumentオブジェクトのリストに変換する関数
+
+        Args:
+            search_results (list[arxiv.Result]): ArXivの検索結果
+
+        Returns:
+            list[Document]: 読み込みに成功したDocumentオブジェクトのリスト（検索結果の順序を保持）
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        documents = await asyncio.gather(*(self._aload_one(result, semaphore) for result in search_results))
+        return [document for document in documents if document is not None]
+
+    async def _aload_one(self, result: arxiv.Result, semaphore: asyncio.Semaphore) -> Optional[Document]:
+        """
+        1件の論文をスレッドプール上で読み込む関数
+
+        タイムアウトした場合、待機は打ち切られますが実行中のスレッドはバックグラウンドで完了まで動作します。
+
+        Args:
+            result (arxiv.Result): ArXivの検索結果
+            semaphore (asyncio.Semaphore): 同時実行数を制限するセマフォ
+
+        Returns:
+            Optional[Document]: 読み込んだDocument。失敗した場合はNone
+        """
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(asyncio.to_thread(self._load, result), timeout=self._timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f'PDFの読み込みがタイムアウトしました: {result.pdf_url}')
+            except Exception as e:
+                logger.error(f'PDFの読み込み中にエラーが発生しました: {result.pdf_url}: {e}')
+            return None
+
+    def _load(self, result: arxiv.Result) -> Optional[Document]:
+        """
+        1件の論文のPDFをダウンロードして解析する関数（ブロッキング）
+
+        Args:
+            result (arxiv.Result): ArXivの検索結果
+
+        Returns:
+            Optional[Document]: 読み込んだDocument。PDFが見つからない場合はNone
+        """
+        pdf_query = result.pdf_url.split('/')[-1]
+        pdf_loader = ArxivLoader(query=pdf_query)
+        pdf_docs = pdf_loader.load()
+        if not pdf_docs:
+            logger.warning(f'PDFドキュメントが見つかりませんでした: {result.pdf_url}')
+            return None
+
+        return pdf_docs[0]
@@ -0,0 +1,55 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.documents import Document
+from src.graphs.article_search.paper_loader import ArxivPaperLoader
+
+
+class FakeArxivPaperLoader(ArxivPaperLoader):
+    def __init__(self, delays: dict[str, float], failures: set[str] = frozenset(), **kwargs):
+        super().__init__(**kwargs)
+        self._delays = delays
+        self._failures = failures
+
+    def _load(self, result):
+        time.sleep(self._delays.get(result.pdf_url, 0))
+        if result.pdf_url in self._failures:
+            raise RuntimeError('broken pdf')
+        return Document(page_content=result.pdf_url)
+
+
+def _results(*urls: str) -> list:
+    return [SimpleNamespace(pdf_url=url) for url in urls]
+
+
+@pytest.mark.asyncio
+async def test_aload_runs_concurrently():
+    urls = [f'http://arxiv.org/pdf/{i}' for i in range(5)]
+    loader = FakeArxivPaperLoader(delays={url: 0.2 for url in urls}, max_concurrency=5)
+
+    started = time.perf_counter()
+    documents = await loader.aload(_results(*urls))
+    elapsed = time.perf_counter() - started
+
+    assert [doc.page_content for doc in documents] == urls
+    assert elapsed < 0.6
+
+
+@pytest.mark.asyncio
+async def test_aload_skips_failed_and_timed_out_papers():
+    loader = FakeArxivPaperLoader(
+        delays={'slow': 1.0},
+        failures={'broken'},
+        max_concurrency=2,
+        timeout=0.2,
+    )
+
+    documents = await loader.aload(_results('ok-1', 'broken', 'slow', 'ok-2'))
+
+    assert [doc.page_content for doc in documents] == ['ok-1', 'ok-2']
+
+
+def test_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        ArxivPaperLoader(max_concurrency=0)